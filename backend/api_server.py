@@ -6,17 +6,23 @@ Provides REST endpoints for file conversion
 
 import os
 import uuid
+import logging
 import tempfile
 import shutil
 from pathlib import Path
-from flask import Flask, request, jsonify, send_file, send_from_directory
+from flask import Flask, request, jsonify, send_file, send_from_directory, Response
 from flask_cors import CORS
 from werkzeug.utils import secure_filename
 from file_converter import FileConversionService
-from tts_service import tts_service
+from tts_service import get_tts_service, MAX_TTS_CHARS
 import threading
 import time
 
+# The TTS service logs its diagnostics through the logging module; wire
+# up a stream handler at INFO once here so those messages reach the
+# console (the default last-resort handler drops anything below WARNING)
+logging.basicConfig(level=logging.INFO, format='%(message)s')
+
 # Load environment variables from .env file
 try:
     from dotenv import load_dotenv
@@ -57,6 +63,13 @@ ALLOWED_EXTENSIONS = {
     'data': {'json', 'xml', 'yaml', 'yml'}
 }
 
+# Precomputed reverse maps so per-request checks are one dict/set lookup
+# instead of a scan over every category
+EXTENSION_CATEGORY = {ext: category
+                      for category, exts in ALLOWED_EXTENSIONS.items()
+                      for ext in exts}
+ALL_EXTENSIONS = set(EXTENSION_CATEGORY)
+
 # Create directories
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 os.makedirs(CONVERTED_FOLDER, exist_ok=True)
@@ -89,11 +102,7 @@ def allowed_file(filename, category=None):
     if category:
         return ext in ALLOWED_EXTENSIONS.get(category, set())
     else:
-        # Check all categories
-        all_extensions = set()
-        for exts in ALLOWED_EXTENSIONS.values():
-            all_extensions.update(exts)
-        return ext in all_extensions
+        return ext in ALL_EXTENSIONS
 
 def get_file_category(filename):
     """Determine file category based on extension"""
@@ -101,11 +110,8 @@ def get_file_category(filename):
         return None
     
     ext = filename.rsplit('.', 1)[1].lower()
-    
-    for category, extensions in ALLOWED_EXTENSIONS.items():
-        if ext in extensions:
-            return category
-    return None
+
+    return EXTENSION_CATEGORY.get(ext)
 
 def cleanup_old_files():
     """Clean up files older than 1 hour"""
@@ -214,7 +220,7 @@ def health_check():
         service_status = f'degraded: {str(e)}'
     
     # Check TTS service
-    tts_health = tts_service.health_check()
+    tts_health = get_tts_service().health_check()
     
     return jsonify({
         'status': service_status,
@@ -376,7 +382,10 @@ def download_file(filename):
             return jsonify({'success': False, 'error': 'File is empty'}), 404
         
         print(f"✅ Sending file: {filepath}")
-        return send_file(filepath, as_attachment=True, download_name=filename)
+        # conditional=True lets Flask use wsgi.file_wrapper/sendfile and
+        # honor Range requests instead of buffering the file in Python
+        return send_file(filepath, as_attachment=True, download_name=filename,
+                         conditional=True)
         
     except Exception as e:
         print(f"❌ Download error: {str(e)}")
@@ -479,7 +488,7 @@ def convert_single_file():
 def get_tts_voices():
     """Get available TTS voices"""
     try:
-        voices_data = tts_service.get_voices()
+        voices_data = get_tts_service().get_voices()
         return jsonify(voices_data)
     except Exception as e:
         return jsonify({
@@ -499,7 +508,12 @@ def text_to_speech():
         text = data.get('text', '').strip()
         if not text:
             return jsonify({'success': False, 'error': 'No text provided'}), 400
-        
+        if len(text) > MAX_TTS_CHARS:
+            return jsonify({
+                'success': False,
+                'error': f'Text too long ({len(text)} characters, max {MAX_TTS_CHARS})'
+            }), 400
+
         # Optional parameters
         rate = data.get('rate')  # Words per minute (100-300)
         volume = data.get('volume')  # 0.0 to 1.0
@@ -527,7 +541,7 @@ def text_to_speech():
         output_path = os.path.join(CONVERTED_FOLDER, filename)
         
         # Convert text to speech
-        success, message = tts_service.text_to_speech_file(
+        success, message = get_tts_service().text_to_speech_file(
             text, output_path, rate, volume, voice_id
         )
         
@@ -550,6 +564,41 @@ def text_to_speech():
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
+@app.route('/api/tts/stream', methods=['POST'])
+def stream_text_to_speech():
+    """Stream synthesized speech sentence by sentence as MP3 audio"""
+    try:
+        data = request.get_json()
+        if not data:
+            return jsonify({'success': False, 'error': 'No JSON data provided'}), 400
+
+        text = data.get('text', '').strip()
+        if not text:
+            return jsonify({'success': False, 'error': 'No text provided'}), 400
+
+        voice_id = data.get('voice_id')
+
+        # Validate here so failures surface as JSON errors — once the
+        # generator starts, the client already has a 200 audio response
+        service = get_tts_service()
+        if not service.is_initialized:
+            return jsonify({'success': False, 'error': 'TTS service not initialized'}), 503
+        if len(text) > MAX_TTS_CHARS:
+            return jsonify({
+                'success': False,
+                'error': f'Text too long ({len(text)} characters, max {MAX_TTS_CHARS})'
+            }), 400
+
+        # Chunks arrive as soon as each sentence is synthesized, so the
+        # client can begin playback without waiting for the whole text
+        return Response(
+            service.text_to_speech_stream(text, voice_id),
+            mimetype='audio/mpeg'
+        )
+
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
 @app.route('/api/tts/preview', methods=['POST'])
 def preview_speech():
     """Preview text-to-speech (play directly without saving)"""
@@ -589,7 +638,7 @@ def preview_speech():
                 return jsonify({'success': False, 'error': 'Invalid volume value'}), 400
         
         # Preview speech
-        success, message = tts_service.preview_speech(text, rate, volume, voice_id)
+        success, message = get_tts_service().preview_speech(text, rate, volume, voice_id)
         
         if success:
             return jsonify({
@@ -606,11 +655,42 @@ def preview_speech():
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
+@app.route('/api/tts/preview/<voice_id>', methods=['GET'])
+def get_voice_preview(voice_id):
+    """Serve the canonical preview clip for a voice.
+
+    Pre-warmed voices (TTS_PREWARM_PREVIEWS) are answered straight from
+    the on-disk cache; a cold voice is synthesized once and cached for
+    every later audition."""
+    try:
+        service = get_tts_service()
+        if not service.is_initialized:
+            return jsonify({'success': False, 'error': 'TTS service not initialized'}), 503
+
+        cached = service.get_cached_path(service.PREVIEW_PHRASE, voice_id=voice_id)
+        if not cached:
+            filename = f"preview_{uuid.uuid4()}.wav"
+            output_path = os.path.join(CONVERTED_FOLDER, filename)
+            success, message = service.text_to_speech_file(
+                service.PREVIEW_PHRASE, output_path, voice_id=voice_id
+            )
+            if not success:
+                return jsonify({'success': False, 'error': message}), 500
+            # Synthesis populates the cache; fall back to the fresh file
+            # if the ffmpeg-less path changed the output extension
+            cached = service.get_cached_path(
+                service.PREVIEW_PHRASE, voice_id=voice_id) or output_path
+
+        return send_file(cached, mimetype='audio/wav', conditional=True)
+
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
 @app.route('/api/tts/health', methods=['GET'])
 def tts_health_check():
     """TTS service health check"""
     try:
-        health_data = tts_service.health_check()
+        health_data = get_tts_service().health_check()
         return jsonify({
             'success': True,
             'health': health_data
@@ -662,6 +742,10 @@ cleanup_thread = threading.Thread(target=cleanup_task)
 cleanup_thread.daemon = True
 cleanup_thread.start()
 
+# Warm the TTS service off the critical path so the first TTS request
+# doesn't pay initialization cost, without blocking server startup
+threading.Thread(target=get_tts_service, daemon=True).start()
+
 if __name__ == '__main__':
     print("Starting FileAlchemy API Server...")
     print(f"Base directory: {BASE_DIR}")
@@ -4,11 +4,64 @@ Supports images, documents, media, and archives
 """
 
 import os
+import io
+import sys
+import queue
+import atexit
+import shutil
+import logging
+import logging.handlers
+import functools
 import subprocess
+import tempfile
+import zipfile
+import tarfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from abc import ABC, abstractmethod
 
+# Libraries used on per-file hot paths are imported once here (guarded the
+# same way the converters' __init__ availability checks are) so convert()
+# calls don't pay a sys.modules lookup for every file in a batch.
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+try:
+    import cairosvg
+except (ImportError, OSError):
+    cairosvg = None
+
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    fitz = None
+
+try:
+    import py7zr
+except ImportError:
+    py7zr = None
+
+try:
+    import rarfile
+except ImportError:
+    rarfile = None
+
+def _scandir_files(root):
+    """Yield os.DirEntry for every regular file under root (depth-first).
+
+    DirEntry.is_file() reuses the type information scandir already got
+    from the directory read, so unlike Path.rglob + is_file this walk
+    does not pay an extra stat() per entry."""
+    for entry in os.scandir(root):
+        if entry.is_dir(follow_symlinks=False):
+            yield from _scandir_files(entry.path)
+        elif entry.is_file(follow_symlinks=False):
+            yield entry
+
 class BaseConverter(ABC):
     """Base class for all file converters"""
     
@@ -28,14 +81,11 @@ class ImageConverter(BaseConverter):
     def __init__(self):
         self.available_libs = {}
         
-        # Check for basic image support (Pillow)
-        try:
-            from PIL import Image
-            self.available_libs['pillow'] = True
-        except ImportError as e:
-            print(f"Basic image conversion unavailable: {e}")
-            self.available_libs['pillow'] = False
-        
+        # Check for basic image support (Pillow, imported at module top)
+        self.available_libs['pillow'] = Image is not None
+        if Image is None:
+            print("Basic image conversion unavailable: Pillow is not installed")
+
         # Check for HEIF support (optional)
         try:
             import pillow_heif
@@ -44,15 +94,12 @@ class ImageConverter(BaseConverter):
         except ImportError as e:
             print(f"HEIF image support unavailable (this is optional): {e}")
             self.available_libs['pillow_heif'] = False
-            
+
         # Check for SVG support (optional, requires system Cairo library)
-        try:
-            import cairosvg
-            self.available_libs['cairosvg'] = True
-        except (ImportError, OSError) as e:
-            print(f"SVG conversion unavailable (this is optional): {e}")
-            self.available_libs['cairosvg'] = False
-            
+        self.available_libs['cairosvg'] = cairosvg is not None
+        if cairosvg is None:
+            print("SVG conversion unavailable (this is optional): cairosvg not installed")
+
         self.available = self.available_libs['pillow']
     
     def convert(self, input_path: str, output_path: str, **kwargs) -> bool:
@@ -67,8 +114,6 @@ class ImageConverter(BaseConverter):
             return self._convert_svg(input_path, output_path, **kwargs)
             
         try:
-            from PIL import Image
-            
             with Image.open(input_path) as img:
                 # Handle different color modes for JPEG conversion
                 if output_ext in ['jpg', 'jpeg']:
@@ -102,10 +147,6 @@ class ImageConverter(BaseConverter):
             return False
             
         try:
-            import cairosvg
-            from PIL import Image
-            import io
-            
             output_ext = Path(output_path).suffix.lower().lstrip('.')
             
             if output_ext in ['png']:
@@ -143,12 +184,8 @@ class DocumentConverter(BaseConverter):
     
     def __init__(self):
         self.available_libs = {}
-        try:
-            import fitz  # PyMuPDF
-            self.available_libs['pymupdf'] = True
-        except ImportError:
-            self.available_libs['pymupdf'] = False
-            
+        self.available_libs['pymupdf'] = fitz is not None
+
         try:
             from pdf2docx import Converter
             self.available_libs['pdf2docx'] = True
@@ -216,12 +253,28 @@ class DocumentConverter(BaseConverter):
         
         return False
     
+    # Page-range size for partitioned PDF->DOCX; ranges are farmed out to
+    # worker processes when the document is bigger than one range.
+    _PDF2DOCX_PAGES_PER_TASK = 10
+
     def _pdf_to_docx(self, input_path: str, output_path: str, **kwargs) -> bool:
         if not self.available_libs['pdf2docx']:
             print("pdf2docx not available")
             return False
-            
+
         try:
+            page_count = 0
+            if fitz is not None:
+                with fitz.open(input_path) as doc:
+                    page_count = doc.page_count
+
+            workers = os.cpu_count() or 1
+            if page_count > self._PDF2DOCX_PAGES_PER_TASK and workers > 1:
+                if self._pdf_to_docx_partitioned(input_path, output_path,
+                                                 page_count, workers):
+                    return True
+                # else fall through to the single-call path
+
             from pdf2docx import Converter
             cv = Converter(input_path)
             cv.convert(output_path, start=0, end=None)
@@ -230,14 +283,46 @@ class DocumentConverter(BaseConverter):
         except Exception as e:
             print(f"PDF to DOCX conversion failed: {e}")
             return False
-    
+
+    def _pdf_to_docx_partitioned(self, input_path: str, output_path: str,
+                                 page_count: int, workers: int) -> bool:
+        """Convert page ranges in parallel processes and stitch the partial
+        documents together. Needs docxcompose + python-docx for the merge;
+        returns False so the caller can fall back to the monolithic call if
+        they're missing or any range fails."""
+        try:
+            import docx
+            from docxcompose.composer import Composer
+        except ImportError:
+            return False
+
+        step = self._PDF2DOCX_PAGES_PER_TASK
+        ranges = [(s, min(s + step, page_count))
+                  for s in range(0, page_count, step)]
+        tmp_dir = tempfile.mkdtemp(prefix='pdf2docx_parts_')
+        try:
+            jobs = [(input_path, os.path.join(tmp_dir, f'part_{i:04d}.docx'), s, e)
+                    for i, (s, e) in enumerate(ranges)]
+            with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+                parts = list(pool.map(_convert_pdf_range_to_docx, jobs))
+
+            composer = Composer(docx.Document(parts[0]))
+            for part in parts[1:]:
+                composer.append(docx.Document(part))
+            composer.save(output_path)
+            return True
+        except Exception as e:
+            print(f"Partitioned PDF to DOCX failed, falling back: {e}")
+            return False
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
     def _pdf_to_text(self, input_path: str, output_path: str, **kwargs) -> bool:
         if not self.available_libs['pymupdf']:
             print("PyMuPDF not available")
             return False
             
         try:
-            import fitz
             doc = fitz.open(input_path)
             text = ""
             for page in doc:
@@ -260,11 +345,6 @@ class DocumentConverter(BaseConverter):
             return False
             
         try:
-            import fitz
-            import zipfile
-            import tempfile
-            import os
-            
             # For PDF to images, we need to determine the target format from kwargs or default to jpg
             target_format = kwargs.get('target_format', 'jpg').lower()
             if target_format in ['jpeg']:
@@ -276,45 +356,32 @@ class DocumentConverter(BaseConverter):
                 print(f"Unsupported image format: {target_format}")
                 return False
             
-            # Open PDF document
-            doc = fitz.open(input_path)
-            
+            # Only the page count is needed here; workers open their own
+            # documents since PyMuPDF objects can't be shared
+            with fitz.open(input_path) as doc:
+                page_count = len(doc)
+
+            # Set resolution (DPI) - higher values = better quality but larger files
+            dpi = kwargs.get('dpi', 150)  # Default 150 DPI
+
             # Create temporary directory for images
             with tempfile.TemporaryDirectory() as temp_dir:
-                image_files = []
-                
-                # Convert each page to image
-                for page_num in range(len(doc)):
-                    page = doc.load_page(page_num)
-                    
-                    # Set resolution (DPI) - higher values = better quality but larger files
-                    dpi = kwargs.get('dpi', 150)  # Default 150 DPI
-                    zoom = dpi / 72  # 72 is the default DPI
-                    mat = fitz.Matrix(zoom, zoom)
-                    
-                    # Render page to pixmap
-                    pix = page.get_pixmap(matrix=mat)
-                    
-                    # Generate filename for this page
-                    base_name = Path(input_path).stem
-                    page_filename = f"{base_name}_page_{page_num + 1:03d}.{target_format}"
-                    page_path = os.path.join(temp_dir, page_filename)
-                    
-                    # Save image
-                    if target_format in ['jpg', 'jpeg']:
-                        # Convert to RGB for JPEG (remove alpha channel)
-                        if pix.alpha:
-                            pix = fitz.Pixmap(fitz.csRGB, pix)
-                        pix.save(page_path)
-                    else:
-                        # PNG supports alpha channel
-                        pix.save(page_path)
-                    
-                    image_files.append((page_filename, page_path))
-                    pix = None  # Free memory
-                
-                doc.close()
-                
+                workers = min(os.cpu_count() or 1, page_count)
+                if workers > 1 and page_count > 4:
+                    # Rasterization is CPU-bound; split the page range
+                    # across worker processes
+                    step = -(-page_count // workers)  # ceil division
+                    jobs = [(input_path, temp_dir, target_format, dpi,
+                             start, min(start + step, page_count))
+                            for start in range(0, page_count, step)]
+                    image_files = []
+                    with ProcessPoolExecutor(max_workers=len(jobs)) as pool:
+                        for rendered in pool.map(_render_pdf_pages, jobs):
+                            image_files.extend(rendered)
+                else:
+                    image_files = _render_pdf_pages(
+                        (input_path, temp_dir, target_format, dpi, 0, page_count))
+
                 # Create ZIP file with all images
                 with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
                     for filename, filepath in image_files:
@@ -347,8 +414,7 @@ class DocumentConverter(BaseConverter):
             from reportlab.lib.styles import getSampleStyleSheet
             from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
             from reportlab.lib import colors
-            import io
-            
+
             # Read DOCX document
             doc = docx.Document(input_path)
             
@@ -738,8 +804,6 @@ class DocumentConverter(BaseConverter):
             
         try:
             # First convert HTML to text, then text to PDF
-            import tempfile
-            
             with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as temp_file:
                 temp_txt_path = temp_file.name
             
@@ -749,9 +813,8 @@ class DocumentConverter(BaseConverter):
             
             # Then convert text to PDF
             result = self._txt_to_pdf(temp_txt_path, output_path, **kwargs)
-            
+
             # Cleanup temp file
-            import os
             try:
                 os.unlink(temp_txt_path)
             except:
@@ -798,21 +861,44 @@ class DocumentConverter(BaseConverter):
         
         return formats
 
+@functools.lru_cache(maxsize=1)
+def _check_ffmpeg() -> bool:
+    """Probe for ffmpeg once per process; cached so repeated
+    MediaConverter constructions (e.g. pool worker initializers)
+    don't each pay a ~20ms subprocess fork."""
+    try:
+        # Discard the probe's output entirely — capture_output would
+        # allocate pipes and buffer text we never read
+        subprocess.run(['ffmpeg', '-version'],
+                     stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                     stderr=subprocess.DEVNULL, check=True, timeout=5)
+        return True
+    except (subprocess.CalledProcessError, FileNotFoundError,
+            subprocess.TimeoutExpired):
+        print("FFmpeg not found. Install FFmpeg for media conversion.")
+        return False
+
+def _run_ffmpeg(cmd: List[str]) -> Tuple[int, str]:
+    """Run an ffmpeg command, draining stderr as it's produced.
+
+    ffmpeg is chatty: capture_output buffers everything it prints into one
+    string, which on long encodes grows without bound. Stream stderr line
+    by line instead and keep only the tail for error reporting. Returns
+    (returncode, last stderr lines)."""
+    proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.PIPE, text=True)
+    tail = deque(maxlen=40)
+    for line in proc.stderr:
+        tail.append(line)
+    proc.stderr.close()
+    return proc.wait(), ''.join(tail)
+
 class MediaConverter(BaseConverter):
     """Handle video/audio conversions using FFmpeg"""
-    
+
     def __init__(self):
-        self.available = self._check_ffmpeg()
-    
-    def _check_ffmpeg(self) -> bool:
-        try:
-            subprocess.run(['ffmpeg', '-version'], 
-                         capture_output=True, check=True)
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            print("FFmpeg not found. Install FFmpeg for media conversion.")
-            return False
-    
+        self.available = _check_ffmpeg()
+
     def convert(self, input_path: str, output_path: str, **kwargs) -> bool:
         if not self.available:
             return False
@@ -844,25 +930,25 @@ class MediaConverter(BaseConverter):
                     
                     # First pass: generate palette
                     palette_cmd = ['ffmpeg', '-i', input_path, '-vf', 'palettegen', '-y', palette_path]
-                    palette_result = subprocess.run(palette_cmd, capture_output=True, text=True)
-                    
-                    if palette_result.returncode == 0:
+                    palette_rc, _ = _run_ffmpeg(palette_cmd)
+
+                    if palette_rc == 0:
                         # Second pass: create GIF with palette
                         fps = kwargs.get('fps', 10)  # Default 10 fps for video to GIF
                         scale = kwargs.get('scale', '320:-1')  # Default scale
                         cmd = ['ffmpeg', '-i', input_path, '-i', palette_path]
                         cmd.extend(['-filter_complex', f'fps={fps},scale={scale}:flags=lanczos[x];[x][1:v]paletteuse'])
                         cmd.extend(['-y', output_path])
-                        
-                        result = subprocess.run(cmd, capture_output=True, text=True)
-                        
+
+                        gif_rc, _ = _run_ffmpeg(cmd)
+
                         # Cleanup palette file
                         try:
                             os.remove(palette_path)
                         except:
                             pass
-                        
-                        if result.returncode == 0:
+
+                        if gif_rc == 0:
                             print(f"Successfully converted {input_ext} to GIF with palette optimization")
                             return True
                     
@@ -875,23 +961,33 @@ class MediaConverter(BaseConverter):
                     
             else:
                 # Standard video/audio conversion
+                if 'preset' in kwargs:
+                    # e.g. 'ultrafast' for throwaway encodes where speed
+                    # matters more than compression efficiency
+                    cmd.extend(['-preset', str(kwargs['preset'])])
+                if 'tune' in kwargs:
+                    cmd.extend(['-tune', str(kwargs['tune'])])
                 if 'quality' in kwargs:
                     cmd.extend(['-crf', str(kwargs['quality'])])
                 if 'bitrate' in kwargs:
                     cmd.extend(['-b:v', kwargs['bitrate']])
                 if 'audio_bitrate' in kwargs:
                     cmd.extend(['-b:a', kwargs['audio_bitrate']])
-            
+
+            # Optional thread cap so batched conversions don't oversubscribe cores
+            if 'threads' in kwargs:
+                cmd.extend(['-threads', str(kwargs['threads'])])
+
             cmd.extend(['-y', output_path])  # -y to overwrite
-            
+
             print(f"Running FFmpeg command: {' '.join(cmd[:5])}... (truncated)")
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            if result.returncode == 0:
+            returncode, stderr_tail = _run_ffmpeg(cmd)
+
+            if returncode == 0:
                 print(f"Media conversion successful: {input_ext} -> {output_ext}")
                 return True
             else:
-                print(f"FFmpeg error: {result.stderr}")
+                print(f"FFmpeg error: {stderr_tail}")
                 return False
             
         except Exception as e:
@@ -899,7 +995,43 @@ class MediaConverter(BaseConverter):
             import traceback
             traceback.print_exc()
             return False
-    
+
+    def convert_many(self, pairs: List[Tuple[str, str]], **kwargs) -> Dict[str, bool]:
+        """Convert several files concurrently with one FFmpeg process each.
+
+        Spawning the processes side by side amortizes process startup and codec
+        init across the batch; each process is capped at 2 encoder threads so
+        the batch doesn't oversubscribe the CPU.
+        """
+        if not self.available:
+            return {input_path: False for input_path, _ in pairs}
+
+        if not pairs:
+            return {}
+
+        max_workers = min(len(pairs), os.cpu_count() or 1)
+        results = {}
+        # Callers may pass their own threads=; don't collide with the
+        # per-process cap below
+        threads = kwargs.pop('threads', 2)
+
+        # subprocess.run releases the GIL while FFmpeg does the work, so
+        # threads are enough to keep all processes running in parallel
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.convert, input_path, output_path,
+                                threads=threads, **kwargs): input_path
+                for input_path, output_path in pairs
+            }
+            for future, input_path in futures.items():
+                try:
+                    results[input_path] = future.result()
+                except Exception as e:
+                    print(f"Media conversion failed for {input_path}: {e}")
+                    results[input_path] = False
+
+        return results
+
     def supported_formats(self) -> Dict[str, List[str]]:
         return {
             'input': ['mp4', 'avi', 'mov', 'mkv', 'wmv', 'flv', 'webm', 'gif', 'mp3', 'wav', 'flac', 'aac', 'ogg'],
@@ -910,35 +1042,14 @@ class ArchiveConverter(BaseConverter):
     """Handle archive conversions using various archive libraries"""
     
     def __init__(self):
-        self.available_libs = {}
-        
-        # Check for built-in zipfile
-        try:
-            import zipfile
-            self.available_libs['zipfile'] = True
-        except ImportError:
-            self.available_libs['zipfile'] = False
-            
-        # Check for tarfile (built-in)
-        try:
-            import tarfile
-            self.available_libs['tarfile'] = True
-        except ImportError:
-            self.available_libs['tarfile'] = False
-            
-        # Check for py7zr
-        try:
-            import py7zr
-            self.available_libs['py7zr'] = True
-        except ImportError:
-            self.available_libs['py7zr'] = False
-            
-        # Check for rarfile
-        try:
-            import rarfile
-            self.available_libs['rarfile'] = True
-        except ImportError:
-            self.available_libs['rarfile'] = False
+        # zipfile/tarfile are stdlib; py7zr/rarfile are optional and imported
+        # at module top
+        self.available_libs = {
+            'zipfile': True,
+            'tarfile': True,
+            'py7zr': py7zr is not None,
+            'rarfile': rarfile is not None,
+        }
     
     def convert(self, input_path: str, output_path: str, **kwargs) -> bool:
         input_ext = Path(input_path).suffix.lower().lstrip('.')
@@ -954,9 +1065,8 @@ class ArchiveConverter(BaseConverter):
             
             # Create output archive
             success = self._create_archive(temp_dir, output_path, output_ext)
-            
+
             # Cleanup
-            import shutil
             shutil.rmtree(temp_dir, ignore_errors=True)
             
             return success
@@ -969,25 +1079,21 @@ class ArchiveConverter(BaseConverter):
         """Extract archive to temporary directory"""
         try:
             if format_type == 'zip' and self.available_libs['zipfile']:
-                import zipfile
                 with zipfile.ZipFile(archive_path, 'r') as zip_ref:
                     zip_ref.extractall(extract_to)
                 return True
-                
+
             elif format_type in ['tar', 'gz', 'tgz'] and self.available_libs['tarfile']:
-                import tarfile
                 with tarfile.open(archive_path, 'r:*') as tar_ref:
                     tar_ref.extractall(extract_to)
                 return True
-                
+
             elif format_type == '7z' and self.available_libs['py7zr']:
-                import py7zr
                 with py7zr.SevenZipFile(archive_path, mode='r') as z:
                     z.extractall(extract_to)
                 return True
-                
+
             elif format_type == 'rar' and self.available_libs['rarfile']:
-                import rarfile
                 with rarfile.RarFile(archive_path) as rf:
                     rf.extractall(extract_to)
                 return True
@@ -997,32 +1103,77 @@ class ArchiveConverter(BaseConverter):
             print(f"Failed to extract {format_type}: {e}")
             return False
     
+    # Entries with these suffixes are already compressed; deflating them
+    # again burns CPU for essentially no size gain, so store them as-is.
+    _STORED_SUFFIXES = {'.zip', '.gz', '.tgz', '.bz2', '.xz', '.7z', '.rar',
+                        '.jpg', '.jpeg', '.png', '.gif', '.webp', '.heic',
+                        '.mp3', '.aac', '.ogg', '.flac', '.mp4', '.mkv',
+                        '.webm', '.mov', '.avi'}
+    _READAHEAD_LIMIT = 32 * 1024 * 1024   # buffer entries up to this size
+    _READAHEAD_BUDGET = 64 * 1024 * 1024  # total pre-read bytes in flight
+
     def _create_archive(self, source_dir: Path, output_path: str, format_type: str) -> bool:
         """Create archive from directory"""
         try:
             if format_type == 'zip' and self.available_libs['zipfile']:
-                import zipfile
-                with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                    for file_path in source_dir.rglob('*'):
-                        if file_path.is_file():
-                            arcname = file_path.relative_to(source_dir)
-                            zipf.write(file_path, arcname)
+                def read_entry(entry):
+                    # Pre-read small entries off-thread; large ones are
+                    # streamed by ZipFile.write on the main thread instead.
+                    if entry.stat().st_size > self._READAHEAD_LIMIT:
+                        return entry, None
+                    with open(entry.path, 'rb') as f:
+                        return entry, f.read()
+
+                workers = min(8, os.cpu_count() or 1)
+                with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zipf, \
+                     ThreadPoolExecutor(max_workers=workers) as pool:
+                    def write_entry(entry, data):
+                        file_path = Path(entry.path)
+                        arcname = file_path.relative_to(source_dir)
+                        compress = (zipfile.ZIP_STORED
+                                    if file_path.suffix.lower() in self._STORED_SUFFIXES
+                                    else zipfile.ZIP_DEFLATED)
+                        if data is None:
+                            zipf.write(file_path, arcname, compress_type=compress)
+                        else:
+                            zipf.writestr(str(arcname), data, compress_type=compress)
+
+                    # Keep only a small window of reads in flight — the
+                    # writer drains at deflate speed, so an unbounded
+                    # submit would buffer most of the directory in RAM.
+                    # The window is capped by total pre-read bytes, not
+                    # just future count, so many near-limit entries can't
+                    # stack up to hundreds of MB.
+                    pending = deque()  # (future, bytes it will buffer)
+                    pending_bytes = 0
+                    for entry in _scandir_files(source_dir):
+                        size = entry.stat().st_size
+                        buffered = size if size <= self._READAHEAD_LIMIT else 0
+                        while pending and (
+                                len(pending) >= workers * 2
+                                or pending_bytes + buffered > self._READAHEAD_BUDGET):
+                            future, freed = pending.popleft()
+                            write_entry(*future.result())
+                            pending_bytes -= freed
+                        pending.append((pool.submit(read_entry, entry), buffered))
+                        pending_bytes += buffered
+                    while pending:
+                        future, _ = pending.popleft()
+                        write_entry(*future.result())
                 return True
                 
             elif format_type in ['tar', 'gz'] and self.available_libs['tarfile']:
-                import tarfile
                 mode = 'w:gz' if format_type == 'gz' else 'w'
                 with tarfile.open(output_path, mode) as tar:
                     tar.add(source_dir, arcname='.')
                 return True
                 
             elif format_type == '7z' and self.available_libs['py7zr']:
-                import py7zr
                 with py7zr.SevenZipFile(output_path, 'w') as archive:
-                    for file_path in source_dir.rglob('*'):
-                        if file_path.is_file():
-                            arcname = file_path.relative_to(source_dir)
-                            archive.write(file_path, arcname)
+                    for entry in _scandir_files(source_dir):
+                        file_path = Path(entry.path)
+                        arcname = file_path.relative_to(source_dir)
+                        archive.write(file_path, arcname)
                 return True
                 
             return False
@@ -1363,8 +1514,6 @@ class DataConverter(BaseConverter):
         print(f"Starting XLSX to PDF conversion: {input_path} -> {output_path}")
         
         # First convert to CSV, then CSV to PDF
-        import tempfile
-        
         with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False, encoding='utf-8') as temp_file:
             temp_csv_path = temp_file.name
         
@@ -1380,7 +1529,6 @@ class DataConverter(BaseConverter):
             
         finally:
             # Cleanup temp file
-            import os
             try:
                 os.unlink(temp_csv_path)
             except:
@@ -1391,8 +1539,6 @@ class DataConverter(BaseConverter):
         print(f"Starting XLSX to TXT conversion: {input_path} -> {output_path}")
         
         # First convert to CSV, then CSV to TXT
-        import tempfile
-        
         with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False, encoding='utf-8') as temp_file:
             temp_csv_path = temp_file.name
         
@@ -1408,7 +1554,6 @@ class DataConverter(BaseConverter):
             
         finally:
             # Cleanup temp file
-            import os
             try:
                 os.unlink(temp_csv_path)
             except:
@@ -1468,8 +1613,6 @@ class DataConverter(BaseConverter):
         print(f"Starting JSON to XLSX conversion: {input_path} -> {output_path}")
         
         # First convert to CSV, then CSV to XLSX
-        import tempfile
-        
         with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False, encoding='utf-8') as temp_file:
             temp_csv_path = temp_file.name
         
@@ -1485,7 +1628,6 @@ class DataConverter(BaseConverter):
             
         finally:
             # Cleanup temp file
-            import os
             try:
                 os.unlink(temp_csv_path)
             except:
@@ -1520,15 +1662,32 @@ class DataConverter(BaseConverter):
 class FileConversionService:
     """Main service class that orchestrates all converters"""
     
+    _converter_classes = {
+        'image': ImageConverter,
+        'document': DocumentConverter,
+        'media': MediaConverter,
+        'archive': ArchiveConverter,
+        'data': DataConverter
+    }
+
     def __init__(self):
-        self.converters = {
-            'image': ImageConverter(),
-            'document': DocumentConverter(),
-            'media': MediaConverter(),
-            'archive': ArchiveConverter(),
-            'data': DataConverter()
-        }
-    
+        self._converters = {}
+
+    def _get_converter(self, conv_type: str) -> BaseConverter:
+        """Instantiate a converter on first use and cache it"""
+        converter = self._converters.get(conv_type)
+        if converter is None:
+            converter = self._converter_classes[conv_type]()
+            self._converters[conv_type] = converter
+        return converter
+
+    @property
+    def converters(self) -> Dict[str, BaseConverter]:
+        """All converters, instantiating any that haven't been used yet"""
+        for conv_type in self._converter_classes:
+            self._get_converter(conv_type)
+        return self._converters
+
     def convert_file(self, input_path: str, output_path: str, **kwargs) -> bool:
         """Convert a file based on its extension"""
         try:
@@ -1562,7 +1721,7 @@ class FileConversionService:
                 return False
             
             print(f"Using converter: {converter_type}")
-            converter = self.converters[converter_type]
+            converter = self._get_converter(converter_type)
             
             # Perform conversion
             result = converter.convert(input_path, output_path, **kwargs)
@@ -1590,8 +1749,8 @@ class FileConversionService:
         if input_ext == 'pdf' and output_ext in ['jpg', 'jpeg', 'png']:
             return 'document'  # DocumentConverter handles PDF to images
         
-        for conv_type, converter in self.converters.items():
-            formats = converter.supported_formats()
+        for conv_type in self._converter_classes:
+            formats = self._get_converter(conv_type).supported_formats()
             if input_ext in formats['input'] and output_ext in formats['output']:
                 return conv_type
         return None
@@ -1614,8 +1773,8 @@ class FileConversionService:
         input_supported = False
         output_supported = False
         
-        for conv_type, converter in self.converters.items():
-            formats = converter.supported_formats()
+        for conv_type in self._converter_classes:
+            formats = self._get_converter(conv_type).supported_formats()
             if input_ext in formats['input']:
                 input_supported = True
             if output_ext in formats['output']:
@@ -1629,25 +1788,106 @@ class FileConversionService:
             return False, f"Conversion from '{input_ext}' to '{output_ext}' is not supported"
     
     def list_supported_formats(self) -> Dict[str, Dict[str, List[str]]]:
-        """List all supported formats by converter type"""
-        return {name: conv.supported_formats() 
-                for name, conv in self.converters.items()}
+        """List all supported formats by converter type.
 
-if __name__ == "__main__":
-    # Example usage
-    service = FileConversionService()
-    
-    # Print supported formats
-    print("Supported formats:")
-    for conv_type, formats in service.list_supported_formats().items():
-        print(f"{conv_type}: {formats}")
+        Library availability can't change within a process, so the result
+        is computed once and reused on later calls."""
+        cached = getattr(self, '_formats_cache', None)
+        if cached is None:
+            cached = {name: conv.supported_formats()
+                      for name, conv in self.converters.items()}
+            self._formats_cache = cached
+        return cached
+
+def _render_pdf_pages(job):
+    """Worker: rasterize a contiguous page range of a PDF to image files.
+
+    Opens its own fitz.Document; PyMuPDF objects must not be shared across
+    processes. Returns [(filename, path), ...] for the rendered pages."""
+    input_path, temp_dir, target_format, dpi, start, end = job
+    base_name = Path(input_path).stem
+    zoom = dpi / 72  # 72 is the default DPI
+    mat = fitz.Matrix(zoom, zoom)
+    rendered = []
+    doc = fitz.open(input_path)
+    try:
+        for page_num in range(start, end):
+            page = doc.load_page(page_num)
+            pix = page.get_pixmap(matrix=mat)
+
+            page_filename = f"{base_name}_page_{page_num + 1:03d}.{target_format}"
+            page_path = os.path.join(temp_dir, page_filename)
+
+            # Convert to RGB for JPEG (remove alpha channel); PNG keeps it
+            if target_format in ['jpg', 'jpeg'] and pix.alpha:
+                pix = fitz.Pixmap(fitz.csRGB, pix)
+            pix.save(page_path)
+
+            rendered.append((page_filename, page_path))
+            pix = None  # Free memory
+    finally:
+        doc.close()
+    return rendered
+
+def _convert_pdf_range_to_docx(job):
+    """Worker: convert one page range of a PDF to a partial .docx."""
+    input_path, part_path, start, end = job
+    from pdf2docx import Converter
+    cv = Converter(input_path)
+    try:
+        cv.convert(part_path, start=start, end=end)
+    finally:
+        cv.close()
+    return part_path
+
+# Per-process state for image batch workers. Each pool worker builds one
+# ImageConverter in its initializer so Pillow/HEIF setup runs once per
+# process instead of once per file.
+_image_worker = None
+
+def _init_image_worker():
+    global _image_worker
+    _image_worker = ImageConverter()
+
+def _convert_image_job(job):
+    src, dst = job
+    try:
+        return src, dst, _image_worker.convert(src, dst)
+    except Exception as e:
+        print(f"Image batch worker failed on {src}: {e}")
+        return src, dst, False
+
+_batch_logger = None
+
+def _get_batch_logger() -> logging.Logger:
+    """Logger for per-file batch progress.
+
+    Records go through a QueueHandler, so conversion workers only enqueue
+    and never contend on the stdout lock; a single QueueListener thread
+    does the actual writes."""
+    global _batch_logger
+    if _batch_logger is None:
+        log_queue = queue.SimpleQueue()
+        # stdout (not stderr) keeps per-file lines in order with the CLI
+        # summary prints; stopping at exit drains anything still queued,
+        # which the daemon listener thread would otherwise drop.
+        listener = logging.handlers.QueueListener(
+            log_queue, logging.StreamHandler(sys.stdout))
+        listener.start()
+        atexit.register(listener.stop)
+        logger = logging.getLogger('filealchemy.batch')
+        logger.setLevel(logging.INFO)
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        logger.propagate = False
+        _batch_logger = logger
+    return _batch_logger
 
 class BatchConverter:
     """Handle batch file conversions with parallel processing"""
-    
+
     def __init__(self, service: FileConversionService):
         self.service = service
-    
+
     def convert_directory(self, input_dir: str, output_dir: str, 
                          input_format: str, output_format: str, 
                          preserve_structure: bool = True) -> Dict[str, bool]:
@@ -1657,27 +1897,80 @@ class BatchConverter:
         output_path.mkdir(parents=True, exist_ok=True)
         
         results = {}
-        
+        created_dirs = {output_path}
+        log = _get_batch_logger()
+
+        # Resolve the converter once up front; otherwise an unsupported
+        # pair fails per file after doing all the path math.
+        converter_type = self.service._get_converter_type(
+            input_format.lower(), output_format.lower())
+        if not converter_type:
+            log.info(f"✗ No converter found for {input_format} -> {output_format}")
+            return results
+        converter = self.service._get_converter(converter_type)
+
         # Find all files with input format
-        pattern = f"**/*.{input_format}" if preserve_structure else f"*.{input_format}"
-        for file_path in input_path.glob(pattern):
-            if file_path.is_file():
+        suffix = f".{input_format}"
+        if preserve_structure:
+            entries = _scandir_files(input_path)
+        else:
+            entries = (e for e in os.scandir(input_path)
+                       if e.is_file(follow_symlinks=False))
+        jobs = []
+        for entry in entries:
+            if entry.name.endswith(suffix):
+                file_path = Path(entry.path)
                 # Calculate output path
                 relative_path = file_path.relative_to(input_path)
                 output_file = output_path / relative_path.with_suffix(f'.{output_format}')
-                
-                # Create output directory if needed
-                output_file.parent.mkdir(parents=True, exist_ok=True)
-                
-                # Convert file
-                success = self.service.convert_file(str(file_path), str(output_file))
-                results[str(file_path)] = success
-                
+
+                # Create output directory if needed (skip the mkdir
+                # syscall for parents we've already created)
+                if output_file.parent not in created_dirs:
+                    output_file.parent.mkdir(parents=True, exist_ok=True)
+                    created_dirs.add(output_file.parent)
+
+                jobs.append((str(file_path), str(output_file)))
+
+        # Image batches are CPU-bound in Pillow decode/encode, so fan them
+        # out across processes with a pre-warmed converter per worker.
+        if converter_type == 'image' and len(jobs) > 1:
+            workers = min(len(jobs), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=workers,
+                                     initializer=_init_image_worker) as pool:
+                chunksize = max(1, len(jobs) // (workers * 4))
+                for src, dst, success in pool.map(_convert_image_job, jobs,
+                                                  chunksize=chunksize):
+                    results[src] = success
+                    if success:
+                        log.info(f"✓ Converted: {src} -> {dst}")
+                    else:
+                        log.info(f"✗ Failed: {src}")
+            return results
+
+        # Media batches run their FFmpeg processes side by side via
+        # convert_many instead of paying full startup cost per loop pass.
+        if converter_type == 'media' and len(jobs) > 1:
+            batch_results = converter.convert_many(jobs)
+            for src, dst in jobs:
+                success = batch_results.get(src, False)
+                results[src] = success
                 if success:
-                    print(f"✓ Converted: {file_path} -> {output_file}")
+                    log.info(f"✓ Converted: {src} -> {dst}")
                 else:
-                    print(f"✗ Failed: {file_path}")
-        
+                    log.info(f"✗ Failed: {src}")
+            return results
+
+        for src, dst in jobs:
+            # Convert file (dispatch already resolved above)
+            success = converter.convert(src, dst)
+            results[src] = success
+
+            if success:
+                log.info(f"✓ Converted: {src} -> {dst}")
+            else:
+                log.info(f"✗ Failed: {src}")
+
         return results
 
 def main():
@@ -6,19 +6,85 @@ Provides high-quality TTS functionality using Google Text-to-Speech (gTTS)
 
 import os
 import uuid
+import shutil
+import hashlib
 import tempfile
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import io
+import re
+import logging
+import unicodedata
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on synthesis input — a huge paste would otherwise occupy
+# the service (and the Google round trips) for its full length
+MAX_TTS_CHARS = int(os.environ.get('MAX_TTS_CHARS', '5000'))
+
+def _normalize_text(text: str) -> str:
+    """Collapse whitespace and NFC-normalize so equivalent inputs produce
+    the same synthesis (and the same cache key)"""
+    return unicodedata.normalize('NFC', re.sub(r'\s+', ' ', text.strip()))
+
+def _fast_copy(src: str, dst: str):
+    """Copy src to dst, preferring a hardlink so cached audio is served
+    without re-reading the bytes through Python; falls back to a regular
+    copy across filesystems"""
+    try:
+        if os.path.exists(dst):
+            os.remove(dst)
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+# Human-readable region names by Google TLD; module-level so voice
+# enumeration doesn't rebuild the dict per lookup
+_TLD_REGION_NAMES = {
+    'com': 'US',
+    'co.uk': 'UK',
+    'com.au': 'Australia',
+    'ca': 'Canada',
+    'es': 'Spain',
+    'com.mx': 'Mexico',
+    'fr': 'France',
+    'de': 'Germany',
+    'it': 'Italy',
+    'pt': 'Portugal',
+    'com.br': 'Brazil',
+    'ru': 'Russia',
+    'co.jp': 'Japan',
+    'co.kr': 'Korea',
+    'co.in': 'India',
+    'nl': 'Netherlands',
+    'se': 'Sweden',
+    'dk': 'Denmark',
+    'no': 'Norway',
+    'fi': 'Finland',
+    'pl': 'Poland',
+    'com.tr': 'Turkey',
+    'co.th': 'Thailand'
+}
 
 class TTSService:
+    # On-disk synthesis cache: identical requests are served by copying
+    # previously generated audio instead of re-synthesizing
+    CACHE_DIR = os.path.join(tempfile.gettempdir(), 'filealchemy_tts_cache')
+    CACHE_MAX_BYTES = 50 * 1024 * 1024
+
     def __init__(self):
         self.available_voices = []
         self.is_initialized = False
         self.lock = threading.Lock()
         self.supported_languages = {}
+        self._voice_by_id = {}
+        self._voices_payload = {}
+        # Directories we have already created — skips the makedirs syscall
+        # on every request once an output dir is known to exist
+        self._ensured_dirs = set()
         self._initialize_service()
     
     def _initialize_service(self):
@@ -46,6 +112,12 @@ class TTSService:
                 self._initialize_voices()
                 self.is_initialized = True
                 print(f"🎤 Google TTS initialized with {len(self.available_voices)} voices")
+
+                # Opt-in: pre-synthesize a short preview per voice into the
+                # cache so voice previews play instantly after cold start.
+                # Off by default because it costs one gTTS request per voice.
+                if os.environ.get('TTS_PREWARM_PREVIEWS', '').lower() in ('1', 'true', 'yes'):
+                    threading.Thread(target=self._prewarm_previews, daemon=True).start()
             else:
                 print("❌ Google TTS not available")
                 self.is_initialized = False
@@ -118,7 +190,21 @@ class TTSService:
                 break
         
         self.available_voices = voices
-        
+
+        # O(1) voice lookup by id or index, and the get_voices API payload
+        # built once here instead of reconstructed on every request
+        self._voice_by_id = {}
+        for voice in voices:
+            self._voice_by_id[voice['id']] = voice
+            self._voice_by_id[str(voice['index'])] = voice
+        self._voices_payload = {
+            'success': True,
+            'voices': voices,
+            'default_voice': voices[0] if voices else None,
+            'engine': 'Google Text-to-Speech',
+            'quality': 'high'
+        }
+
         # Log available voices
         for voice in voices[:5]:  # Show first 5
             print(f"🎤 Voice: {voice['name']} (ID: {voice['id']})")
@@ -127,33 +213,75 @@ class TTSService:
     
     def _get_region_name(self, tld: str) -> str:
         """Get human-readable region name from TLD"""
-        region_map = {
-            'com': 'US',
-            'co.uk': 'UK',
-            'com.au': 'Australia',
-            'ca': 'Canada',
-            'es': 'Spain',
-            'com.mx': 'Mexico',
-            'fr': 'France',
-            'de': 'Germany',
-            'it': 'Italy',
-            'pt': 'Portugal',
-            'com.br': 'Brazil',
-            'ru': 'Russia',
-            'co.jp': 'Japan',
-            'co.kr': 'Korea',
-            'co.in': 'India',
-            'nl': 'Netherlands',
-            'se': 'Sweden',
-            'dk': 'Denmark',
-            'no': 'Norway',
-            'fi': 'Finland',
-            'pl': 'Poland',
-            'com.tr': 'Turkey',
-            'co.th': 'Thailand'
-        }
-        return region_map.get(tld, '')
+        return _TLD_REGION_NAMES.get(tld, '')
     
+    def _cache_path(self, text: str, rate: Optional[int], volume: Optional[float],
+                    language: str, tld: str, suffix: str) -> str:
+        """Build the cache file path for one synthesis request"""
+        key = hashlib.sha256(
+            f"{text}|{rate}|{volume}|{language}|{tld}".encode('utf-8')
+        ).hexdigest()
+        return os.path.join(self.CACHE_DIR, f"{key}{suffix}")
+
+    def _evict_cache(self):
+        """Drop oldest cache entries until the directory is under its cap"""
+        try:
+            entries = [(e.stat().st_mtime, e.stat().st_size, e.path)
+                       for e in os.scandir(self.CACHE_DIR) if e.is_file()]
+        except OSError:
+            return
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.CACHE_MAX_BYTES:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                continue
+
+    PREVIEW_PHRASE = "This is a voice preview."
+
+    def _prewarm_previews(self):
+        """Synthesize the canonical preview phrase for every voice into the
+        cache so first-time previews are served at cache-hit latency"""
+        temp_dir = tempfile.mkdtemp(prefix="tts_prewarm_")
+        try:
+            for voice in self.available_voices:
+                voice_id = voice['id']
+                if self.get_cached_path(self.PREVIEW_PHRASE, voice_id=voice_id):
+                    continue
+                temp_path = os.path.join(temp_dir, f"{uuid.uuid4()}.wav")
+                try:
+                    self.text_to_speech_file(self.PREVIEW_PHRASE, temp_path,
+                                             voice_id=voice_id)
+                finally:
+                    Path(temp_path).unlink(missing_ok=True)
+            logger.info("🔥 Voice preview cache pre-warmed")
+        except Exception as e:
+            logger.warning("⚠️  Preview pre-warm aborted: %s", e)
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def get_cached_path(self, text: str, rate: Optional[int] = None,
+                        volume: Optional[float] = None,
+                        voice_id: Optional[str] = None,
+                        suffix: str = '.wav') -> Optional[str]:
+        """Return the on-disk cache file for a synthesis request, or None if
+        it has not been generated yet. Callers can hand the path straight to
+        Flask's send_file so cached audio is served without an extra copy."""
+        text = _normalize_text(text)
+        language = 'en'
+        tld = 'com'
+        if voice_id and voice_id != 'default':
+            voice = self._voice_by_id.get(str(voice_id))
+            if voice:
+                language = voice['language']
+                tld = voice['tld']
+        cache_path = self._cache_path(text, rate, volume, language, tld, suffix)
+        return cache_path if os.path.exists(cache_path) else None
+
     def get_voices(self) -> Dict:
         """Get available voices for API response"""
         if not self.is_initialized:
@@ -163,13 +291,7 @@ class TTSService:
                 'voices': []
             }
         
-        return {
-            'success': True,
-            'voices': self.available_voices,
-            'default_voice': self.available_voices[0] if self.available_voices else None,
-            'engine': 'Google Text-to-Speech',
-            'quality': 'high'
-        }
+        return self._voices_payload
     
 
 
@@ -183,7 +305,11 @@ class TTSService:
         
         if not self.is_initialized:
             return False, "Google TTS service not initialized"
-        
+
+        text = _normalize_text(text)
+        if len(text) > MAX_TTS_CHARS:
+            return False, f"Text too long ({len(text)} characters, max {MAX_TTS_CHARS})"
+
         try:
             from gtts import gTTS
             import pygame
@@ -195,99 +321,134 @@ class TTSService:
             tld = 'com'
             
             if voice_id and voice_id != 'default':
-                # Find the voice in available voices
-                selected_voice = None
-                for voice in self.available_voices:
-                    if voice['id'] == voice_id or str(voice['index']) == str(voice_id):
-                        selected_voice = voice
-                        break
-                
+                # O(1) lookup by id or index
+                selected_voice = self._voice_by_id.get(str(voice_id))
                 if selected_voice:
                     language = selected_voice['language']
                     tld = selected_voice['tld']
-                    print(f"🎤 Using voice: {selected_voice['name']} ({language}-{tld})")
+                    logger.info("🎤 Using voice: %s (%s-%s)", selected_voice['name'], language, tld)
                 else:
-                    print(f"⚠️  Voice {voice_id} not found, using default")
+                    logger.warning("⚠️  Voice %s not found, using default", voice_id)
             
-            # Ensure output directory exists
+            # Ensure output directory exists (once per directory — repeat
+            # requests to the same folder skip the syscall)
             output_dir = os.path.dirname(output_path)
-            if output_dir:
+            if output_dir and output_dir not in self._ensured_dirs:
                 os.makedirs(output_dir, exist_ok=True)
-            
-            print(f"🔊 Converting text to speech with Google TTS...")
-            print(f"📝 Text length: {len(text)} characters")
-            print(f"🌍 Language: {language}, TLD: {tld}")
+                self._ensured_dirs.add(output_dir)
+
+            # Serve repeated conversions straight from the on-disk cache —
+            # a file copy instead of a round trip to Google TTS
+            suffix = Path(output_path).suffix or '.wav'
+            cache_path = self._cache_path(text, rate, volume, language, tld, suffix)
+            if os.path.exists(cache_path):
+                _fast_copy(cache_path, output_path)
+                logger.info("⚡ Served from TTS cache")
+                return True, "Success"
+
+            logger.info("🔊 Converting text to speech with Google TTS...")
+            logger.debug("📝 Text length: %d characters", len(text))
+            logger.debug("🌍 Language: %s, TLD: %s", language, tld)
             
             # Create gTTS object
             tts = gTTS(text=text, lang=language, tld=tld, slow=False)
             
             # Save to a temporary MP3 file first
-            temp_mp3 = output_path.replace('.wav', '_temp.mp3')
+            temp_mp3 = f"{os.path.splitext(output_path)[0]}_temp.mp3"
             tts.save(temp_mp3)
-            print(f"✅ Google TTS generated MP3 file")
+            logger.debug("✅ Google TTS generated MP3 file")
             
-            # Convert MP3 to WAV and apply rate/volume adjustments
-            try:
-                # Load the MP3 file
-                audio = AudioSegment.from_mp3(temp_mp3)
-                
-                # Apply rate adjustment (speed change)
-                if rate and rate != 200:
-                    # Calculate speed multiplier (200 WPM is baseline)
-                    speed_multiplier = rate / 200.0
-                    speed_multiplier = max(0.5, min(2.0, speed_multiplier))  # Limit to reasonable range
-                    
-                    if speed_multiplier != 1.0:
-                        audio = speedup(audio, playback_speed=speed_multiplier)
-                        print(f"🎛️  Applied speed adjustment: {speed_multiplier}x")
-                
-                # Apply volume adjustment
-                if volume and volume != 0.9:
-                    # Convert volume (0.0-1.0) to dB change
-                    volume_db = 20 * (volume - 0.9)  # 0.9 is baseline
-                    volume_db = max(-20, min(20, volume_db))  # Limit to reasonable range
-                    
-                    if abs(volume_db) > 0.1:
-                        audio = audio + volume_db
-                        print(f"🔊 Applied volume adjustment: {volume_db:.1f}dB")
-                
-                # Export as WAV
-                audio.export(output_path, format="wav")
-                print(f"✅ Converted to WAV format")
-                
-                # Clean up temporary MP3 file
-                if os.path.exists(temp_mp3):
-                    os.remove(temp_mp3)
-                
-            except ImportError as import_error:
-                print(f"⚠️  Audio processing libraries not available: {import_error}")
-                print("🔄 Using basic MP3 to WAV conversion...")
-                
-                # Fallback: simple conversion without rate/volume adjustment
+            # MP3 output with default rate/volume: the gTTS file already is
+            # the final artifact — skip the decode/re-encode round trip and
+            # ship the compressed audio as-is (~10x smaller than WAV)
+            needs_adjustment = (rate and rate != 200) or (volume and volume != 0.9)
+            if suffix == '.mp3' and not needs_adjustment:
+                os.replace(temp_mp3, output_path)
+                logger.debug("✅ Kept compressed MP3 output directly")
+            else:
+                # Convert MP3 to WAV and apply rate/volume adjustments
                 try:
-                    import subprocess
-                    # Try using ffmpeg if available
-                    subprocess.run([
-                        'ffmpeg', '-i', temp_mp3, '-acodec', 'pcm_s16le', 
-                        '-ar', '22050', '-ac', '1', output_path, '-y'
-                    ], check=True, capture_output=True)
-                    print(f"✅ Converted using ffmpeg")
-                    
+                    # Load the MP3 file
+                    audio = AudioSegment.from_mp3(temp_mp3)
+
+                    # Apply rate adjustment (speed change)
+                    if rate and rate != 200:
+                        # Calculate speed multiplier (200 WPM is baseline)
+                        speed_multiplier = rate / 200.0
+                        speed_multiplier = max(0.5, min(2.0, speed_multiplier))  # Limit to reasonable range
+
+                        if speed_multiplier != 1.0:
+                            audio = speedup(audio, playback_speed=speed_multiplier)
+                            logger.debug("🎛️  Applied speed adjustment: %sx", speed_multiplier)
+
+                    # Apply volume adjustment
+                    if volume and volume != 0.9:
+                        # Convert volume (0.0-1.0) to dB change
+                        volume_db = 20 * (volume - 0.9)  # 0.9 is baseline
+                        volume_db = max(-20, min(20, volume_db))  # Limit to reasonable range
+
+                        if abs(volume_db) > 0.1:
+                            audio = audio + volume_db
+                            logger.debug("🔊 Applied volume adjustment: %.1fdB", volume_db)
+
+                    # Export in the requested container
+                    audio.export(output_path, format=suffix.lstrip('.') or "wav")
+                    logger.debug("✅ Converted to %s format", suffix.lstrip('.') or 'wav')
+
                     # Clean up temporary MP3 file
                     if os.path.exists(temp_mp3):
                         os.remove(temp_mp3)
-                        
-                except (subprocess.CalledProcessError, FileNotFoundError):
-                    # If ffmpeg not available, just rename MP3 to WAV (not ideal but works)
-                    print("⚠️  ffmpeg not available, keeping as MP3 format")
-                    if os.path.exists(temp_mp3):
-                        os.rename(temp_mp3, output_path.replace('.wav', '.mp3'))
-                        output_path = output_path.replace('.wav', '.mp3')
+
+                except ImportError as import_error:
+                    logger.warning("⚠️  Audio processing libraries not available: %s", import_error)
+                    logger.info("🔄 Using basic MP3 to WAV conversion...")
+
+                    # Fallback: simple conversion without rate/volume adjustment
+                    try:
+                        import subprocess
+                        # Try using ffmpeg if available
+                        # Discard ffmpeg's chatter and bound the call so a
+                        # wedged process can't hang the request thread
+                        subprocess.run([
+                            'ffmpeg', '-i', temp_mp3, '-acodec', 'pcm_s16le',
+                            '-ar', '22050', '-ac', '1', output_path, '-y'
+                        ], check=True, stdin=subprocess.DEVNULL,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                            timeout=60)
+                        logger.debug("✅ Converted using ffmpeg")
+
+                        # Clean up temporary MP3 file
+                        if os.path.exists(temp_mp3):
+                            os.remove(temp_mp3)
+
+                    except (subprocess.CalledProcessError, FileNotFoundError,
+                            subprocess.TimeoutExpired):
+                        # If ffmpeg not available, just rename MP3 to WAV (not ideal but works)
+                        logger.warning("⚠️  ffmpeg not available, keeping as MP3 format")
+                        if os.path.exists(temp_mp3):
+                            os.rename(temp_mp3, output_path.replace('.wav', '.mp3'))
+                            output_path = output_path.replace('.wav', '.mp3')
             
-            # Verify file was created
-            if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
-                file_size = os.path.getsize(output_path)
-                print(f"📄 Generated high-quality audio file: {file_size} bytes")
+            # Verify file was created — one stat covers existence and size
+            try:
+                file_size = os.stat(output_path).st_size
+            except OSError:
+                file_size = 0
+            if file_size > 0:
+                logger.info("📄 Generated high-quality audio file: %d bytes", file_size)
+
+                # Populate the cache (skip if the fallback changed the
+                # output extension, so cached content matches its suffix)
+                if Path(output_path).suffix == suffix:
+                    try:
+                        if self.CACHE_DIR not in self._ensured_dirs:
+                            os.makedirs(self.CACHE_DIR, exist_ok=True)
+                            self._ensured_dirs.add(self.CACHE_DIR)
+                        _fast_copy(output_path, cache_path)
+                        self._evict_cache()
+                    except OSError:
+                        pass
+
                 return True, "Success"
             else:
                 return False, "Audio file was not created or is empty"
@@ -301,7 +462,51 @@ class TTSService:
             print(f"❌ {error_msg}")
             return False, error_msg
     
-    def preview_speech(self, text: str, 
+    def text_to_speech_stream(self, text: str,
+                              voice_id: Optional[str] = None):
+        """Yield MP3 audio chunks sentence by sentence as they are
+        synthesized, so clients can start playback before the full
+        utterance is ready instead of waiting for one big file"""
+        if not text or not text.strip():
+            return
+        if not self.is_initialized:
+            return
+
+        text = _normalize_text(text)
+        if len(text) > MAX_TTS_CHARS:
+            return
+
+        from gtts import gTTS
+
+        language = 'en'
+        tld = 'com'
+        if voice_id and voice_id != 'default':
+            voice = self._voice_by_id.get(str(voice_id))
+            if voice:
+                language = voice['language']
+                tld = voice['tld']
+
+        def synth(sentence: str) -> bytes:
+            buf = io.BytesIO()
+            gTTS(text=sentence, lang=language, tld=tld, slow=False).write_to_fp(buf)
+            return buf.getvalue()
+
+        # Cheap sentence split — each sentence becomes one synthesis
+        # request, so time-to-first-audio is one sentence, not the text.
+        # Sentences are fetched concurrently (synthesis is network-bound)
+        # and yielded in order, so later chunks are ready by the time the
+        # client finishes playing earlier ones.
+        sentences = [s for s in re.split(r'(?<=[.!?])\s+', text) if s]
+        if len(sentences) <= 1:
+            for sentence in sentences:
+                yield synth(sentence)
+            return
+
+        with ThreadPoolExecutor(max_workers=min(4, len(sentences))) as executor:
+            for chunk in executor.map(synth, sentences):
+                yield chunk
+
+    def preview_speech(self, text: str,
                       rate: Optional[int] = None,
                       volume: Optional[float] = None,
                       voice_id: Optional[str] = None) -> Tuple[bool, str]:
@@ -312,6 +517,8 @@ class TTSService:
         if not self.is_initialized:
             return False, "Google TTS service not initialized"
         
+        text = _normalize_text(text)
+
         # For server environments, we can't actually play audio
         # So we'll just validate the text and return success
         try:
@@ -321,14 +528,10 @@ class TTSService:
             
             # Parse voice_id to validate it exists
             if voice_id and voice_id != 'default':
-                voice_found = False
-                for voice in self.available_voices:
-                    if voice['id'] == voice_id or str(voice['index']) == str(voice_id):
-                        voice_found = True
-                        print(f"🎤 Preview would use voice: {voice['name']}")
-                        break
-                
-                if not voice_found:
+                voice = self._voice_by_id.get(str(voice_id))
+                if voice:
+                    print(f"🎤 Preview would use voice: {voice['name']}")
+                else:
                     print(f"⚠️  Voice {voice_id} not found, would use default")
             
             print(f"🎵 Preview validated for {len(text)} characters")
@@ -389,5 +592,17 @@ class TTSService:
         except:
             return False
 
-# Global TTS service instance
-tts_service = TTSService()
\ No newline at end of file
+# Lazy singleton — constructing TTSService probes gTTS availability and
+# enumerates voices, so importing this module (e.g. for py_compile or
+# tooling) should not pay that cost. First caller initializes.
+_tts_service = None
+_tts_service_lock = threading.Lock()
+
+def get_tts_service() -> TTSService:
+    """Return the shared TTSService, creating it on first use"""
+    global _tts_service
+    if _tts_service is None:
+        with _tts_service_lock:
+            if _tts_service is None:
+                _tts_service = TTSService()
+    return _tts_service
\ No newline at end of file
@@ -6,30 +6,40 @@ Builds frontend and deploys to Railway
 
 import os
 import sys
+import shutil
 import subprocess
 import time
 
-def run_command(command, description, shell=True):
-    """Run a command and handle errors"""
+def find_tool(name):
+    """Locate a CLI tool, handling Windows .cmd shims"""
+    return shutil.which(name) or shutil.which(f"{name}.cmd")
+
+def run_command(command, description):
+    """Run a command (argument list, no shell) and handle errors.
+
+    stdout goes to DEVNULL so multi-megabyte build logs are never
+    buffered in Python; only stderr is kept for failure reporting."""
     print(f"🔄 {description}...")
     try:
-        result = subprocess.run(command, shell=shell, check=True, capture_output=True, text=True)
+        subprocess.run(command, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                       text=True)
         print(f"✅ {description} completed")
-        if result.stdout.strip():
-            print(f"   Output: {result.stdout.strip()}")
         return True
     except subprocess.CalledProcessError as e:
         print(f"❌ {description} failed")
-        if e.stdout:
-            print(f"   Output: {e.stdout}")
         if e.stderr:
-            print(f"   Error: {e.stderr}")
+            print(f"   Error: {e.stderr.strip()}")
         return False
 
 def check_railway_cli():
     """Check if Railway CLI is installed"""
+    railway = find_tool('railway')
+    if not railway:
+        print("❌ Railway CLI not installed")
+        return False
     try:
-        result = subprocess.run(['railway', '--version'], capture_output=True, text=True, shell=True)
+        result = subprocess.run([railway, '--version'], capture_output=True, text=True)
         if result.returncode == 0:
             print(f"✅ Railway CLI found: {result.stdout.strip()}")
             return True
@@ -53,7 +63,11 @@ def main():
         sys.exit(1)
     
     # Build frontend
-    if not run_command("npm run build", "Building frontend"):
+    npm = find_tool('npm')
+    if not npm:
+        print("❌ npm not found on PATH")
+        sys.exit(1)
+    if not run_command([npm, 'run', 'build'], "Building frontend"):
         sys.exit(1)
     
     # Check if dist directory exists
@@ -65,7 +79,7 @@ def main():
     
     # Deploy to Railway
     print("\n🚂 Deploying to Railway...")
-    if not run_command("railway up", "Deploying to Railway"):
+    if not run_command([find_tool('railway'), 'up'], "Deploying to Railway"):
         print("❌ Deployment failed")
         sys.exit(1)
     
@@ -5,8 +5,6 @@ Shows current file cleanup status and configuration
 """
 
 import requests
-import json
-import time
 from datetime import datetime, timedelta
 
 def check_cleanup_status():
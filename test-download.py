@@ -3,50 +3,76 @@
 Test script to verify TTS API endpoints
 """
 
+import atexit
+
 import requests
 import json
-import time
+from concurrent.futures import ThreadPoolExecutor
 
 # Test configuration
 BASE_URL = "http://localhost:5000"  # Local development server
 TEST_TEXT = "Hello! This is a test of the FileAlchemy text-to-speech system. It should work perfectly!"
 
+# Shared session so the sequential API calls reuse one keep-alive
+# connection instead of paying TCP setup per request
+SESSION = requests.Session()
+SESSION.mount("http://", requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=32))
+atexit.register(SESSION.close)
+
+def _emit(lines):
+    """Write one section's output with a single print instead of a
+    write syscall per line"""
+    print("\n".join(lines))
+
 def test_tts_api():
     print("🧪 Testing TTS API Endpoints...")
     
+    # The health and voices probes are independent, so fire them
+    # concurrently and report in order — wall clock is the slower RTT
+    # instead of the sum of both
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        health_future = executor.submit(SESSION.get, f"{BASE_URL}/api/tts/health", timeout=10)
+        voices_future = executor.submit(SESSION.get, f"{BASE_URL}/api/tts/voices", timeout=10)
+
     # Test 1: Health check
-    print("\n1. Testing TTS Health Check:")
+    lines = ["\n1. Testing TTS Health Check:"]
     try:
-        response = requests.get(f"{BASE_URL}/api/tts/health", timeout=10)
+        response = health_future.result()
         if response.status_code == 200:
             data = response.json()
-            print(f"   ✅ Health check successful")
-            print(f"   📊 Health data: {json.dumps(data, indent=2)}")
+            lines.append("   ✅ Health check successful")
+            lines.append(f"   📊 Health data: {json.dumps(data, indent=2)}")
+            _emit(lines)
         else:
-            print(f"   ❌ Health check failed: {response.status_code}")
+            lines.append(f"   ❌ Health check failed: {response.status_code}")
+            _emit(lines)
             return False
     except Exception as e:
-        print(f"   ❌ Health check error: {e}")
+        lines.append(f"   ❌ Health check error: {e}")
+        _emit(lines)
         return False
-    
+
     # Test 2: Get voices
-    print("\n2. Testing Get Voices:")
+    lines = ["\n2. Testing Get Voices:"]
     try:
-        response = requests.get(f"{BASE_URL}/api/tts/voices", timeout=10)
+        response = voices_future.result()
         if response.status_code == 200:
             data = response.json()
-            print(f"   ✅ Get voices successful")
+            lines.append("   ✅ Get voices successful")
             if data.get('success') and data.get('voices'):
-                print(f"   🎤 Available voices: {len(data['voices'])}")
+                lines.append(f"   🎤 Available voices: {len(data['voices'])}")
                 for i, voice in enumerate(data['voices'][:2]):  # Show first 2
-                    print(f"      Voice {i}: {voice.get('name', 'Unknown')}")
+                    lines.append(f"      Voice {i}: {voice.get('name', 'Unknown')}")
             else:
-                print(f"   ⚠️  No voices available: {data}")
+                lines.append(f"   ⚠️  No voices available: {data}")
+            _emit(lines)
         else:
-            print(f"   ❌ Get voices failed: {response.status_code}")
+            lines.append(f"   ❌ Get voices failed: {response.status_code}")
+            _emit(lines)
             return False
     except Exception as e:
-        print(f"   ❌ Get voices error: {e}")
+        lines.append(f"   ❌ Get voices error: {e}")
+        _emit(lines)
         return False
     
     # Test 3: Convert text to speech
@@ -58,7 +84,7 @@ def test_tts_api():
             "volume": 0.8
         }
         
-        response = requests.post(
+        response = SESSION.post(
             f"{BASE_URL}/api/tts/convert", 
             json=payload,
             timeout=30
@@ -66,32 +92,40 @@ def test_tts_api():
         
         if response.status_code == 200:
             data = response.json()
-            print(f"   ✅ TTS conversion successful")
-            print(f"   📄 Filename: {data.get('filename')}")
-            print(f"   📊 File size: {data.get('size')} bytes")
-            print(f"   🔗 Download URL: {data.get('download_url')}")
-            
+            _emit([
+                "   ✅ TTS conversion successful",
+                f"   📄 Filename: {data.get('filename')}",
+                f"   📊 File size: {data.get('size')} bytes",
+                f"   🔗 Download URL: {data.get('download_url')}",
+            ])
+
             # Test download
             if data.get('download_url'):
-                print("\n4. Testing Audio File Download:")
+                lines = ["\n4. Testing Audio File Download:"]
                 download_url = f"{BASE_URL}{data['download_url']}"
-                download_response = requests.get(download_url, timeout=10)
-                
-                if download_response.status_code == 200:
-                    print(f"   ✅ Download successful")
-                    print(f"   📊 Downloaded size: {len(download_response.content)} bytes")
-                    
-                    # Save test file
-                    with open("test_downloaded_audio.wav", "wb") as f:
-                        f.write(download_response.content)
-                    print(f"   💾 Saved as: test_downloaded_audio.wav")
-                else:
-                    print(f"   ❌ Download failed: {download_response.status_code}")
-                    return False
-            
+                # Stream straight to disk — the audio never sits in RAM
+                # as one big bytes object
+                with SESSION.get(download_url, timeout=10, stream=True) as download_response:
+                    if download_response.status_code == 200:
+                        total = 0
+                        with open("test_downloaded_audio.wav", "wb") as f:
+                            for chunk in download_response.iter_content(chunk_size=64 * 1024):
+                                f.write(chunk)
+                                total += len(chunk)
+                        lines.append("   ✅ Download successful")
+                        lines.append(f"   📊 Downloaded size: {total} bytes")
+                        lines.append("   💾 Saved as: test_downloaded_audio.wav")
+                        _emit(lines)
+                    else:
+                        lines.append(f"   ❌ Download failed: {download_response.status_code}")
+                        _emit(lines)
+                        return False
+
         else:
-            print(f"   ❌ TTS conversion failed: {response.status_code}")
-            print(f"   📄 Response: {response.text}")
+            _emit([
+                f"   ❌ TTS conversion failed: {response.status_code}",
+                f"   📄 Response: {response.text}",
+            ])
             return False
             
     except Exception as e:
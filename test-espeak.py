@@ -71,8 +71,12 @@ def test_espeak_synthesis():
         ], capture_output=True, text=True, timeout=10)
         
         if result.returncode == 0:
-            if os.path.exists(output_file) and os.path.getsize(output_file) > 0:
-                file_size = os.path.getsize(output_file)
+            # Single stat instead of exists + getsize
+            try:
+                file_size = os.stat(output_file).st_size
+            except OSError:
+                file_size = 0
+            if file_size > 0:
                 print(f"✅ eSpeak synthesis successful: {file_size} bytes")
                 # Clean up test file
                 os.remove(output_file)
@@ -119,8 +123,11 @@ def test_pyttsx3_integration():
         engine.save_to_file(test_text, output_file)
         engine.runAndWait()
         
-        if os.path.exists(output_file) and os.path.getsize(output_file) > 0:
-            file_size = os.path.getsize(output_file)
+        try:
+            file_size = os.stat(output_file).st_size
+        except OSError:
+            file_size = 0
+        if file_size > 0:
             print(f"✅ pyttsx3 synthesis successful: {file_size} bytes")
             os.remove(output_file)
         else:
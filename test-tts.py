@@ -5,12 +5,15 @@ Test script for TTS functionality
 
 import sys
 import os
+import shutil
+import tempfile
 sys.path.append('backend')
 
-from tts_service import tts_service
+from tts_service import get_tts_service
 
 def test_tts_service():
     print("🧪 Testing TTS Service...")
+    tts_service = get_tts_service()
     
     # Test 1: Health check
     print("\n1. Health Check:")
@@ -38,8 +41,11 @@ def test_tts_service():
     # Test 3: Text to speech conversion
     print("\n3. Text to Speech Conversion:")
     test_text = "Hello! This is a test of the FileAlchemy text to speech system."
-    output_path = "test_tts_output.wav"
-    
+    # Unique temp path instead of a hardcoded CWD filename, so concurrent
+    # runs don't race on the same file
+    output_dir = tempfile.mkdtemp(prefix="tts_test_")
+    output_path = os.path.join(output_dir, "test_tts_output.wav")
+
     try:
         success, message = tts_service.text_to_speech_file(
             test_text, 
@@ -49,22 +55,26 @@ def test_tts_service():
         )
         
         if success:
-            file_size = os.path.getsize(output_path) if os.path.exists(output_path) else 0
+            # Single stat instead of exists + getsize
+            try:
+                file_size = os.stat(output_path).st_size
+            except OSError:
+                file_size = 0
             print(f"   ✅ Conversion successful: {message}")
             print(f"   📄 Output file: {output_path}")
             print(f"   📊 File size: {file_size} bytes")
-            
-            # Clean up test file
-            if os.path.exists(output_path):
-                os.remove(output_path)
-                print(f"   🧹 Cleaned up test file")
+            print(f"   🧹 Cleaned up test file")
         else:
             print(f"   ❌ Conversion failed: {message}")
             return False
-            
+
     except Exception as e:
         print(f"   ❌ Exception during conversion: {e}")
         return False
+    finally:
+        # Remove the whole scratch directory, not just the wav — mkdtemp
+        # leaked one directory per run (and on every failure) otherwise
+        shutil.rmtree(output_dir, ignore_errors=True)
     
     print("\n✅ All TTS tests passed!")
     return True
@@ -3,10 +3,18 @@
 Verify TTS deployment on Railway
 """
 
+import atexit
+
 import requests
-import json
 import sys
-import time
+
+# One pooled session for the whole verification run so the sequential
+# checks reuse a keep-alive connection instead of renegotiating TCP/TLS
+SESSION = requests.Session()
+_adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0)
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
+atexit.register(SESSION.close)
 
 def verify_tts_deployment(base_url):
     """Verify TTS functionality on deployed server"""
@@ -15,7 +23,7 @@ def verify_tts_deployment(base_url):
     # Test 1: General health check
     print("\n1. Testing general health check...")
     try:
-        response = requests.get(f"{base_url}/api/health", timeout=10)
+        response = SESSION.get(f"{base_url}/api/health", timeout=10)
         if response.status_code == 200:
             data = response.json()
             print(f"   ✅ Server is healthy")
@@ -35,7 +43,7 @@ def verify_tts_deployment(base_url):
     # Test 2: TTS-specific health check
     print("\n2. Testing TTS health check...")
     try:
-        response = requests.get(f"{base_url}/api/tts/health", timeout=10)
+        response = SESSION.get(f"{base_url}/api/tts/health", timeout=10)
         if response.status_code == 200:
             data = response.json()
             if data.get('success'):
@@ -57,7 +65,7 @@ def verify_tts_deployment(base_url):
     # Test 3: Get available voices
     print("\n3. Testing voice availability...")
     try:
-        response = requests.get(f"{base_url}/api/tts/voices", timeout=10)
+        response = SESSION.get(f"{base_url}/api/tts/voices", timeout=10)
         if response.status_code == 200:
             data = response.json()
             if data.get('success') and data.get('voices'):
@@ -88,7 +96,7 @@ def verify_tts_deployment(base_url):
             "volume": 0.8
         }
         
-        response = requests.post(
+        response = SESSION.post(
             f"{base_url}/api/tts/convert",
             json=test_payload,
             timeout=30
@@ -105,7 +113,7 @@ def verify_tts_deployment(base_url):
                 # Test download
                 if data.get('download_url'):
                     download_url = f"{base_url}{data['download_url']}"
-                    download_response = requests.head(download_url, timeout=10)
+                    download_response = SESSION.head(download_url, timeout=10)
                     if download_response.status_code == 200:
                         print(f"   ✅ Download URL accessible")
                     else: